@@ -1,12 +1,16 @@
 """The Reptile Habitat Manager integration."""
+import asyncio
+from functools import partial
 import logging
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import config_validation as cv
 
 from .const import (
+    ATTR_CONFIG_ENTRY_ID,
     DOMAIN,
     PLATFORMS,
     SERVICE_LOG_FEEDING,
@@ -17,6 +21,26 @@ from .coordinator import ReptileHabitatCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+SERVICE_LOG_FEEDING_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Required("food_type"): cv.string,
+    vol.Required("food_size"): cv.string,
+    vol.Optional("notes", default=""): cv.string,
+})
+
+SERVICE_LOG_SHEDDING_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Required("complete"): cv.boolean,
+    vol.Optional("notes", default=""): cv.string,
+})
+
+SERVICE_LOG_WEIGHT_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Required("weight"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    vol.Optional("unit", default="g"): vol.In(["g", "kg", "oz", "lb"]),
+    vol.Optional("notes", default=""): cv.string,
+})
+
 type ReptileHabitatConfigEntry = ConfigEntry[ReptileHabitatCoordinator]
 
 
@@ -26,88 +50,80 @@ async def async_setup_entry(hass: HomeAssistant, entry: ReptileHabitatConfigEntr
     await coordinator.async_config_entry_first_refresh()
     
     entry.runtime_data = coordinator
+    hass.data.setdefault(DOMAIN, {}).setdefault("coordinators", {})[entry.entry_id] = coordinator
     
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    
-    # Setup services
-    await _async_setup_services(hass)
+    # Set up platforms and services concurrently
+    await asyncio.gather(
+        hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+        _async_setup_services(hass),
+    )
     
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ReptileHabitatConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        hass.data[DOMAIN]["coordinators"].pop(entry.entry_id, None)
+    return unload_ok
 
 
-async def _async_setup_services(hass: HomeAssistant) -> None:
-    """Set up services."""
-    
-    async def log_feeding(call):
-        """Log feeding service."""
-        food_type = call.data.get("food_type")
-        food_size = call.data.get("food_size") 
-        notes = call.data.get("notes", "")
-        
-        # Find coordinator from any reptile habitat entry
-        for entry in hass.config_entries.async_entries(DOMAIN):
-            coordinator = entry.runtime_data
-            await coordinator.log_feeding(food_type, food_size, notes)
-            break
-    
-    async def log_shedding(call):
-        """Log shedding service."""
-        complete = call.data.get("complete")
-        notes = call.data.get("notes", "")
-        
-        for entry in hass.config_entries.async_entries(DOMAIN):
-            coordinator = entry.runtime_data
-            await coordinator.log_shedding(complete, notes)
-            break
-    
-    async def log_weight(call):
-        """Log weight service."""
-        weight = call.data.get("weight")
-        unit = call.data.get("unit", "g")
-        notes = call.data.get("notes", "")
-        
-        for entry in hass.config_entries.async_entries(DOMAIN):
-            coordinator = entry.runtime_data
-            await coordinator.log_weight(weight, unit, notes)
-            break
-    
-    # Register services if not already registered
-    if not hass.services.has_service(DOMAIN, SERVICE_LOG_FEEDING):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_LOG_FEEDING,
-            log_feeding,
-            schema=vol.Schema({
-                vol.Required("food_type"): cv.string,
-                vol.Required("food_size"): cv.string,
-                vol.Optional("notes", default=""): cv.string,
-            })
-        )
+def _get_coordinator(hass: HomeAssistant, call: ServiceCall) -> ReptileHabitatCoordinator:
+    """Return the coordinator targeted by a service call."""
+    coordinators = hass.data[DOMAIN]["coordinators"]
+    if entry_id := call.data.get(ATTR_CONFIG_ENTRY_ID):
+        if entry_id not in coordinators:
+            raise ServiceValidationError(f"Reptile habitat entry {entry_id} is not loaded")
+        return coordinators[entry_id]
     
-    if not hass.services.has_service(DOMAIN, SERVICE_LOG_SHEDDING):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_LOG_SHEDDING,
-            log_shedding,
-            schema=vol.Schema({
-                vol.Required("complete"): cv.boolean,
-                vol.Optional("notes", default=""): cv.string,
-            })
-        )
+    # Fall back to the first loaded habitat
+    for coordinator in coordinators.values():
+        return coordinator
+    raise ServiceValidationError("No reptile habitat is loaded")
+
+
+async def _async_log_feeding(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Log feeding service."""
+    coordinator = _get_coordinator(hass, call)
+    await coordinator.log_feeding(
+        call.data["food_type"], call.data["food_size"], call.data["notes"]
+    )
+
+
+async def _async_log_shedding(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Log shedding service."""
+    coordinator = _get_coordinator(hass, call)
+    await coordinator.log_shedding(call.data["complete"], call.data["notes"])
+
+
+async def _async_log_weight(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Log weight service."""
+    coordinator = _get_coordinator(hass, call)
+    await coordinator.log_weight(call.data["weight"], call.data["unit"], call.data["notes"])
+
+
+async def _async_setup_services(hass: HomeAssistant) -> None:
+    """Set up services once for all config entries."""
+    store = hass.data.setdefault(DOMAIN, {})
+    if store.get("services_registered"):
+        return
+    store["services_registered"] = True
     
-    if not hass.services.has_service(DOMAIN, SERVICE_LOG_WEIGHT):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_LOG_WEIGHT,
-            log_weight,
-            schema=vol.Schema({
-                vol.Required("weight"): vol.All(vol.Coerce(float), vol.Range(min=0)),
-                vol.Optional("unit", default="g"): vol.In(["g", "kg", "oz", "lb"]),
-                vol.Optional("notes", default=""): cv.string,
-            })
-        )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LOG_FEEDING,
+        partial(_async_log_feeding, hass),
+        schema=SERVICE_LOG_FEEDING_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LOG_SHEDDING,
+        partial(_async_log_shedding, hass),
+        schema=SERVICE_LOG_SHEDDING_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LOG_WEIGHT,
+        partial(_async_log_weight, hass),
+        schema=SERVICE_LOG_WEIGHT_SCHEMA,
+    )
@@ -1,8 +1,6 @@
 """Binary sensor platform for Reptile Habitat Manager."""
 from __future__ import annotations
 
-from datetime import datetime
-
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
@@ -10,10 +8,18 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import (
+    CONF_HEAT_NAME,
+    CONF_HEAT_SOURCES,
+    CRITICAL_STATUSES,
+    DOMAIN,
+    STATUS_UNKNOWN,
+)
 from .coordinator import ReptileHabitatCoordinator
+from .entity import ReptileHabitatEntity
+
+PARALLEL_UPDATES = 0
 
 
 async def async_setup_entry(
@@ -24,29 +30,30 @@ async def async_setup_entry(
     """Set up binary sensor entities."""
     coordinator: ReptileHabitatCoordinator = entry.runtime_data
     
-    entities = []
+    heat_source_count = len(coordinator.config["heat_sources"])
     
-    # Heat source binary sensors
-    for i in range(len(coordinator.config["heat_sources"])):
-        entities.extend([
-            HeatSourceProblemSensor(coordinator, entry, i),
-            HeatSourceActiveSensor(coordinator, entry, i),
-        ])
-    
-    # General binary sensors
-    entities.extend([
+    entities = [
+        # Heat source binary sensors
+        *(HeatSourceProblemSensor(coordinator, entry, i) for i in range(heat_source_count)),
+        *(HeatSourceActiveSensor(coordinator, entry, i) for i in range(heat_source_count)),
+        # General binary sensors
         AtmosphereProblemSensor(coordinator, entry),
         OverallHealthSensor(coordinator, entry),
         FeedingOverdueSensor(coordinator, entry),
         WeightLossSensor(coordinator, entry),
-    ])
+    ]
     
     async_add_entities(entities)
 
 
-class HeatSourceProblemSensor(CoordinatorEntity[ReptileHabitatCoordinator], BinarySensorEntity):
+class HeatSourceProblemSensor(ReptileHabitatEntity, BinarySensorEntity):
     """Binary sensor for heat source problems."""
 
+    __slots__ = ("_entry", "_heat_source_index", "_heat_data")
+
+    _attr_has_entity_name = True
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+
     def __init__(
         self,
         coordinator: ReptileHabitatCoordinator,
@@ -54,54 +61,39 @@ class HeatSourceProblemSensor(CoordinatorEntity[ReptileHabitatCoordinator], Bina
         heat_source_index: int,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
         self._entry = entry
         self._heat_source_index = heat_source_index
-        self._attr_has_entity_name = True
-        self._attr_device_class = BinarySensorDeviceClass.PROBLEM
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_heat_{self._heat_source_index}_problem"
-
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        if self.coordinator.data:
-            heat_data = self.coordinator.data["heat_sources"].get(self._heat_source_index)
-            if heat_data:
-                return f"{self.coordinator.reptile_name} {heat_data['name']} Problem"
-        return f"{self.coordinator.reptile_name} Heat Source {self._heat_source_index} Problem"
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if there's a problem."""
-        if not self.coordinator.data:
-            return False
-            
-        heat_data = self.coordinator.data["heat_sources"].get(self._heat_source_index, {})
-        status = heat_data.get("status", "unknown")
-        return status.startswith("critical") or status == "unknown"
+        self._attr_unique_id = f"{entry.entry_id}_heat_{heat_source_index}_problem"
+        heat_name = coordinator.config[CONF_HEAT_SOURCES][heat_source_index][CONF_HEAT_NAME]
+        self._attr_name = f"{coordinator.reptile_name} {heat_name} Problem"
+        super().__init__(coordinator)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, any]:
-        """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
-            
-        heat_data = self.coordinator.data["heat_sources"].get(self._heat_source_index, {})
-        return {
+    def _update_from_data(self) -> None:
+        """Cache this heat source's slice of the coordinator data."""
+        heat_data = self.coordinator.data["heat_sources"][self._heat_source_index]
+        self._heat_data = heat_data
+        self._attr_extra_state_attributes = {
             "status": heat_data.get("status"),
             "current_temp": heat_data.get("current_temp"),
             "target_min": heat_data.get("target_min"),
             "target_max": heat_data.get("target_max"),
         }
 
+    @property
+    def is_on(self) -> bool:
+        """Return true if there's a problem."""
+        status = self._heat_data.get("status", STATUS_UNKNOWN)
+        return status in CRITICAL_STATUSES or status == STATUS_UNKNOWN
+
 
-class HeatSourceActiveSensor(CoordinatorEntity[ReptileHabitatCoordinator], BinarySensorEntity):
+class HeatSourceActiveSensor(ReptileHabitatEntity, BinarySensorEntity):
     """Binary sensor for heat source activity."""
 
+    __slots__ = ("_entry", "_heat_source_index", "_heat_data")
+
+    _attr_has_entity_name = True
+    _attr_device_class = BinarySensorDeviceClass.HEAT
+
     def __init__(
         self,
         coordinator: ReptileHabitatCoordinator,
@@ -109,34 +101,21 @@ class HeatSourceActiveSensor(CoordinatorEntity[ReptileHabitatCoordinator], Binar
         heat_source_index: int,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
         self._entry = entry
         self._heat_source_index = heat_source_index
-        self._attr_has_entity_name = True
-        self._attr_device_class = BinarySensorDeviceClass.HEAT
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_heat_{self._heat_source_index}_active"
+        self._attr_unique_id = f"{entry.entry_id}_heat_{heat_source_index}_active"
+        heat_name = coordinator.config[CONF_HEAT_SOURCES][heat_source_index][CONF_HEAT_NAME]
+        self._attr_name = f"{coordinator.reptile_name} {heat_name} Active"
+        super().__init__(coordinator)
 
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        if self.coordinator.data:
-            heat_data = self.coordinator.data["heat_sources"].get(self._heat_source_index)
-            if heat_data:
-                return f"{self.coordinator.reptile_name} {heat_data['name']} Active"
-        return f"{self.coordinator.reptile_name} Heat Source {self._heat_source_index} Active"
+    def _update_from_data(self) -> None:
+        """Cache this heat source's slice of the coordinator data."""
+        self._heat_data = self.coordinator.data["heat_sources"][self._heat_source_index]
 
     @property
     def is_on(self) -> bool:
         """Return true if heat source is active."""
-        if not self.coordinator.data:
-            return False
-            
-        heat_data = self.coordinator.data["heat_sources"].get(self._heat_source_index, {})
-        return heat_data.get("is_heating", False)
+        return self._heat_data.get("is_heating", False)
 
     @property
     def icon(self) -> str:
@@ -144,64 +123,30 @@ class HeatSourceActiveSensor(CoordinatorEntity[ReptileHabitatCoordinator], Binar
         return "mdi:fire" if self.is_on else "mdi:fire-off"
 
 
-class AtmosphereProblemSensor(CoordinatorEntity[ReptileHabitatCoordinator], BinarySensorEntity):
+class AtmosphereProblemSensor(ReptileHabitatEntity, BinarySensorEntity):
     """Binary sensor for atmosphere problems."""
 
+    __slots__ = ("_entry", "_atmosphere_data")
+
+    _attr_has_entity_name = True
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+
     def __init__(
         self,
         coordinator: ReptileHabitatCoordinator,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
         self._entry = entry
-        self._attr_has_entity_name = True
-        self._attr_device_class = BinarySensorDeviceClass.PROBLEM
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_atmosphere_problem"
-
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        return f"{self.coordinator.reptile_name} Atmosphere Problem"
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if there's an atmosphere problem."""
-        if not self.coordinator.data:
-            return False
-            
-        atmosphere_data = self.coordinator.data.get("atmosphere", {})
-        
-        # Check temperature
-        current_temp = atmosphere_data.get("current_temp")
-        if current_temp is not None:
-            critical_min_temp = atmosphere_data.get("critical_min_temp", 0)
-            critical_max_temp = atmosphere_data.get("critical_max_temp", 150)
-            if current_temp <= critical_min_temp or current_temp >= critical_max_temp:
-                return True
-        
-        # Check humidity
-        current_humidity = atmosphere_data.get("current_humidity")
-        if current_humidity is not None:
-            critical_min_humidity = atmosphere_data.get("critical_min_humidity", 0)
-            critical_max_humidity = atmosphere_data.get("critical_max_humidity", 100)
-            if current_humidity <= critical_min_humidity or current_humidity >= critical_max_humidity:
-                return True
-        
-        return False
+        self._attr_unique_id = f"{entry.entry_id}_atmosphere_problem"
+        self._attr_name = f"{coordinator.reptile_name} Atmosphere Problem"
+        super().__init__(coordinator)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, any]:
-        """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
-            
-        atmosphere_data = self.coordinator.data.get("atmosphere", {})
-        return {
+    def _update_from_data(self) -> None:
+        """Cache the atmosphere slice of the coordinator data."""
+        atmosphere_data = self.coordinator.data["atmosphere"]
+        self._atmosphere_data = atmosphere_data
+        self._attr_extra_state_attributes = {
             "current_temp": atmosphere_data.get("current_temp"),
             "current_humidity": atmosphere_data.get("current_humidity"),
             "critical_min_temp": atmosphere_data.get("critical_min_temp"),
@@ -210,69 +155,43 @@ class AtmosphereProblemSensor(CoordinatorEntity[ReptileHabitatCoordinator], Bina
             "critical_max_humidity": atmosphere_data.get("critical_max_humidity"),
         }
 
+    @property
+    def is_on(self) -> bool:
+        """Return true if there's an atmosphere problem."""
+        return self._atmosphere_data.get("problem", False)
+
 
-class OverallHealthSensor(CoordinatorEntity[ReptileHabitatCoordinator], BinarySensorEntity):
+class OverallHealthSensor(ReptileHabitatEntity, BinarySensorEntity):
     """Binary sensor for overall habitat health."""
 
+    __slots__ = ("_entry",)
+
+    _attr_has_entity_name = True
+    _attr_device_class = BinarySensorDeviceClass.SAFETY
+
     def __init__(
         self,
         coordinator: ReptileHabitatCoordinator,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
         self._entry = entry
-        self._attr_has_entity_name = True
-        self._attr_device_class = BinarySensorDeviceClass.SAFETY
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_overall_health"
+        self._attr_unique_id = f"{entry.entry_id}_overall_health"
+        self._attr_name = f"{coordinator.reptile_name} Habitat Healthy"
+        super().__init__(coordinator)
 
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        return f"{self.coordinator.reptile_name} Habitat Healthy"
+    def _update_from_data(self) -> None:
+        """Read the habitat health from the coordinator data."""
+        self._attr_is_on = self.coordinator.data.get("overall_healthy", False)
+        self._attr_icon = "mdi:check-circle" if self._attr_is_on else "mdi:alert-circle"
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if habitat is healthy."""
-        if not self.coordinator.data:
-            return False
-            
-        # Check heat sources
-        heat_sources = self.coordinator.data.get("heat_sources", {})
-        for heat_data in heat_sources.values():
-            if heat_data.get("status", "").startswith("critical"):
-                return False
-        
-        # Check atmosphere
-        atmosphere_data = self.coordinator.data.get("atmosphere", {})
-        current_temp = atmosphere_data.get("current_temp")
-        if current_temp is not None:
-            critical_min_temp = atmosphere_data.get("critical_min_temp", 0)
-            critical_max_temp = atmosphere_data.get("critical_max_temp", 150)
-            if current_temp <= critical_min_temp or current_temp >= critical_max_temp:
-                return False
-        
-        current_humidity = atmosphere_data.get("current_humidity")
-        if current_humidity is not None:
-            critical_min_humidity = atmosphere_data.get("critical_min_humidity", 0)
-            critical_max_humidity = atmosphere_data.get("critical_max_humidity", 100)
-            if current_humidity <= critical_min_humidity or current_humidity >= critical_max_humidity:
-                return False
-        
-        return True
 
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:check-circle" if self.is_on else "mdi:alert-circle"
+class FeedingOverdueSensor(ReptileHabitatEntity, BinarySensorEntity):
+    """Binary sensor for overdue feeding."""
 
+    __slots__ = ("_entry",)
 
-class FeedingOverdueSensor(CoordinatorEntity[ReptileHabitatCoordinator], BinarySensorEntity):
-    """Binary sensor for overdue feeding."""
+    _attr_has_entity_name = True
 
     def __init__(
         self,
@@ -280,123 +199,80 @@ class FeedingOverdueSensor(CoordinatorEntity[ReptileHabitatCoordinator], BinaryS
         entry: ConfigEntry,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
         self._entry = entry
-        self._attr_has_entity_name = True
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_feeding_overdue"
-
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        return f"{self.coordinator.reptile_name} Feeding Overdue"
+        self._attr_unique_id = f"{entry.entry_id}_feeding_overdue"
+        self._attr_name = f"{coordinator.reptile_name} Feeding Overdue"
+        super().__init__(coordinator)
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if feeding is overdue."""
-        if not self.coordinator.data:
-            return False
-            
-        feeding_log = self.coordinator.data["care"]["feeding_log"]
-        if not feeding_log:
-            return True  # No feeding recorded = overdue
-            
-        last_feeding = feeding_log[-1]
-        days_since = (datetime.now() - last_feeding["date"]).days
+    def _update_from_data(self) -> None:
+        """Read whether feeding is overdue from the coordinator data."""
+        care = self.coordinator.data["care"]
+        days_since = care["days_since_feeding"]
+        # No feeding recorded counts as overdue; otherwise allow 14 days
+        self._attr_is_on = days_since is None or days_since > 14
+        self._attr_icon = "mdi:food-off" if self._attr_is_on else "mdi:food"
         
-        # Consider feeding overdue after 14 days (adjust as needed)
-        return days_since > 14
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:food-off" if self.is_on else "mdi:food"
-
-    @property
-    def extra_state_attributes(self) -> dict[str, any]:
-        """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
-            
-        feeding_log = self.coordinator.data["care"]["feeding_log"]
+        feeding_log = care["feeding_log"]
         if feeding_log:
-            last_feeding = feeding_log[-1]
-            days_since = (datetime.now() - last_feeding["date"]).days
-            return {
+            self._attr_extra_state_attributes = {
                 "days_since_feeding": days_since,
-                "last_food_type": last_feeding.get("food_type"),
+                "last_food_type": feeding_log[-1].get("food_type"),
+                "feeding_threshold_days": 14,
+            }
+        else:
+            self._attr_extra_state_attributes = {
+                "days_since_feeding": "unknown",
                 "feeding_threshold_days": 14,
             }
-        return {"days_since_feeding": "unknown", "feeding_threshold_days": 14}
 
 
-class WeightLossSensor(CoordinatorEntity[ReptileHabitatCoordinator], BinarySensorEntity):
+class WeightLossSensor(ReptileHabitatEntity, BinarySensorEntity):
     """Binary sensor for significant weight loss."""
 
+    __slots__ = ("_entry",)
+
+    _attr_has_entity_name = True
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+
     def __init__(
         self,
         coordinator: ReptileHabitatCoordinator,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
         self._entry = entry
-        self._attr_has_entity_name = True
-        self._attr_device_class = BinarySensorDeviceClass.PROBLEM
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_weight_loss"
+        self._attr_unique_id = f"{entry.entry_id}_weight_loss"
+        self._attr_name = f"{coordinator.reptile_name} Significant Weight Loss"
+        super().__init__(coordinator)
 
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        return f"{self.coordinator.reptile_name} Significant Weight Loss"
+    def _update_from_data(self) -> None:
+        """Build the weight change attributes from the latest measurements."""
+        care = self.coordinator.data["care"]
+        weight_log = care["weight_log"]
+        weight_loss_percent = care["weight_loss_percent"]
+        if len(weight_log) >= 2:
+            self._attr_extra_state_attributes = {
+                "current_weight": weight_log[-1]["weight"],
+                "previous_weight": weight_log[-2]["weight"],
+                "weight_change": round(care["weight_change"], 1),
+                "weight_loss_percent": (
+                    round(weight_loss_percent, 1) if weight_loss_percent is not None else None
+                ),
+                "weight_loss_threshold": 10,
+            }
+        else:
+            self._attr_extra_state_attributes = {}
 
     @property
     def is_on(self) -> bool:
         """Return true if there's significant weight loss."""
-        if not self.coordinator.data:
-            return False
-            
-        weight_log = self.coordinator.data["care"]["weight_log"]
-        if len(weight_log) < 2:
-            return False
-            
-        current_weight = weight_log[-1]["weight"]
-        previous_weight = weight_log[-2]["weight"]
+        weight_loss_percent = self.coordinator.data["care"]["weight_loss_percent"]
         
-        # Consider >10% weight loss as significant
-        weight_loss_percent = ((previous_weight - current_weight) / previous_weight) * 100
-        return weight_loss_percent > 10
+        # Consider >10% weight loss as significant; a gain from a zero
+        # weight has no percentage and is never a loss
+        return weight_loss_percent is not None and weight_loss_percent > 10
 
     @property
     def icon(self) -> str:
         """Return the icon."""
         return "mdi:trending-down" if self.is_on else "mdi:scale"
-
-    @property
-    def extra_state_attributes(self) -> dict[str, any]:
-        """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
-            
-        weight_log = self.coordinator.data["care"]["weight_log"]
-        if len(weight_log) >= 2:
-            current_weight = weight_log[-1]["weight"]
-            previous_weight = weight_log[-2]["weight"]
-            weight_change = current_weight - previous_weight
-            weight_loss_percent = ((previous_weight - current_weight) / previous_weight) * 100
-            
-            return {
-                "current_weight": current_weight,
-                "previous_weight": previous_weight,
-                "weight_change": round(weight_change, 1),
-                "weight_loss_percent": round(weight_loss_percent, 1),
-                "weight_loss_threshold": 10,
-            }
-        return {}
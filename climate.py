@@ -11,10 +11,20 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import (
+    CONF_ATMO_TARGET_MAX_TEMP,
+    CONF_ATMO_TARGET_MIN_TEMP,
+    CONF_HEAT_NAME,
+    CONF_HEAT_SOURCES,
+    CONF_TARGET_MAX,
+    CONF_TARGET_MIN,
+    DOMAIN,
+)
 from .coordinator import ReptileHabitatCoordinator
+from .entity import ReptileHabitatEntity
+
+PARALLEL_UPDATES = 0
 
 
 async def async_setup_entry(
@@ -25,11 +35,11 @@ async def async_setup_entry(
     """Set up climate entities."""
     coordinator: ReptileHabitatCoordinator = entry.runtime_data
     
-    entities = []
-    
     # Create climate entity for each heat source
-    for i in range(len(coordinator.config["heat_sources"])):
-        entities.append(HeatSourceClimate(coordinator, entry, i))
+    entities = [
+        HeatSourceClimate(coordinator, entry, i)
+        for i in range(len(coordinator.config["heat_sources"]))
+    ]
     
     # Add tank atmosphere climate
     entities.append(AtmosphereClimate(coordinator, entry))
@@ -37,9 +47,18 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class HeatSourceClimate(CoordinatorEntity[ReptileHabitatCoordinator], ClimateEntity):
+class HeatSourceClimate(ReptileHabitatEntity, ClimateEntity):
     """Climate entity for individual heat sources."""
 
+    __slots__ = ("_entry", "_heat_source_index")
+
+    _attr_has_entity_name = True
+    _attr_temperature_unit = UnitOfTemperature.FAHRENHEIT
+    _attr_hvac_mode = HVACMode.HEAT
+    _attr_hvac_modes = [HVACMode.HEAT]
+    _attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
+    _attr_hvac_action = HVACAction.OFF
+
     def __init__(
         self,
         coordinator: ReptileHabitatCoordinator,
@@ -47,101 +66,28 @@ class HeatSourceClimate(CoordinatorEntity[ReptileHabitatCoordinator], ClimateEnt
         heat_source_index: int,
     ) -> None:
         """Initialize the climate entity."""
-        super().__init__(coordinator)
         self._entry = entry
         self._heat_source_index = heat_source_index
-        self._attr_has_entity_name = True
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_heat_{self._heat_source_index}"
-
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        if self.coordinator.data:
-            heat_data = self.coordinator.data["heat_sources"].get(self._heat_source_index)
-            if heat_data:
-                return f"{self.coordinator.reptile_name} {heat_data['name']}"
-        return f"{self.coordinator.reptile_name} Heat Source {self._heat_source_index}"
-
-    @property
-    def temperature_unit(self) -> str:
-        """Return the unit of measurement."""
-        return UnitOfTemperature.FAHRENHEIT
-
-    @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature."""
-        if self.coordinator.data:
-            heat_data = self.coordinator.data["heat_sources"].get(self._heat_source_index)
-            if heat_data:
-                return heat_data.get("current_temp")
-        return None
-
-    @property
-    def target_temperature(self) -> float | None:
-        """Return the target temperature."""
-        if self.coordinator.data:
-            heat_data = self.coordinator.data["heat_sources"].get(self._heat_source_index)
-            if heat_data:
-                target_min = heat_data.get("target_min", 75)
-                target_max = heat_data.get("target_max", 85)
-                return (target_min + target_max) / 2
-        return None
-
-    @property
-    def target_temperature_high(self) -> float | None:
-        """Return the high target temperature."""
-        if self.coordinator.data:
-            heat_data = self.coordinator.data["heat_sources"].get(self._heat_source_index)
-            if heat_data:
-                return heat_data.get("target_max")
-        return None
-
-    @property
-    def target_temperature_low(self) -> float | None:
-        """Return the low target temperature."""
-        if self.coordinator.data:
-            heat_data = self.coordinator.data["heat_sources"].get(self._heat_source_index)
-            if heat_data:
-                return heat_data.get("target_min")
-        return None
-
-    @property
-    def hvac_mode(self) -> HVACMode:
-        """Return current HVAC mode."""
-        return HVACMode.HEAT
-
-    @property
-    def hvac_modes(self) -> list[HVACMode]:
-        """Return available HVAC modes."""
-        return [HVACMode.HEAT]
-
-    @property
-    def hvac_action(self) -> HVACAction:
-        """Return current HVAC action."""
-        if self.coordinator.data:
-            heat_data = self.coordinator.data["heat_sources"].get(self._heat_source_index)
-            if heat_data and heat_data.get("is_heating"):
-                return HVACAction.HEATING
-            return HVACAction.IDLE
-        return HVACAction.OFF
-
-    @property
-    def supported_features(self) -> ClimateEntityFeature:
-        """Return supported features."""
-        return ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
+        self._attr_unique_id = f"{entry.entry_id}_heat_{heat_source_index}"
+        heat_config = coordinator.config[CONF_HEAT_SOURCES][heat_source_index]
+        self._attr_name = f"{coordinator.reptile_name} {heat_config[CONF_HEAT_NAME]}"
+        
+        # Targets come from the entry config and only change on reload
+        self._attr_target_temperature_low = heat_config[CONF_TARGET_MIN]
+        self._attr_target_temperature_high = heat_config[CONF_TARGET_MAX]
+        self._attr_target_temperature = (
+            heat_config[CONF_TARGET_MIN] + heat_config[CONF_TARGET_MAX]
+        ) / 2
+        super().__init__(coordinator)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, any]:
-        """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
-            
-        heat_data = self.coordinator.data["heat_sources"].get(self._heat_source_index, {})
-        return {
+    def _update_from_data(self) -> None:
+        """Read the current temperature and heating state from the coordinator data."""
+        heat_data = self.coordinator.data["heat_sources"][self._heat_source_index]
+        self._attr_current_temperature = heat_data.get("current_temp")
+        self._attr_hvac_action = (
+            HVACAction.HEATING if heat_data.get("is_heating") else HVACAction.IDLE
+        )
+        self._attr_extra_state_attributes = {
             "critical_min": heat_data.get("critical_min"),
             "critical_max": heat_data.get("critical_max"),
             "status": heat_data.get("status"),
@@ -150,104 +96,43 @@ class HeatSourceClimate(CoordinatorEntity[ReptileHabitatCoordinator], ClimateEnt
         }
 
 
-class AtmosphereClimate(CoordinatorEntity[ReptileHabitatCoordinator], ClimateEntity):
+class AtmosphereClimate(ReptileHabitatEntity, ClimateEntity):
     """Climate entity for tank atmosphere."""
 
+    __slots__ = ("_entry",)
+
+    _attr_has_entity_name = True
+    _attr_temperature_unit = UnitOfTemperature.FAHRENHEIT
+    _attr_hvac_mode = HVACMode.AUTO
+    _attr_hvac_modes = [HVACMode.AUTO]
+    _attr_hvac_action = HVACAction.IDLE
+    _attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
+
     def __init__(
         self,
         coordinator: ReptileHabitatCoordinator,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the atmosphere climate entity."""
-        super().__init__(coordinator)
         self._entry = entry
-        self._attr_has_entity_name = True
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_atmosphere"
-
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        return f"{self.coordinator.reptile_name} Tank Atmosphere"
-
-    @property
-    def temperature_unit(self) -> str:
-        """Return the unit of measurement."""
-        return UnitOfTemperature.FAHRENHEIT
-
-    @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature."""
-        if self.coordinator.data:
-            atmosphere_data = self.coordinator.data.get("atmosphere", {})
-            return atmosphere_data.get("current_temp")
-        return None
-
-    @property
-    def current_humidity(self) -> float | None:
-        """Return the current humidity."""
-        if self.coordinator.data:
-            atmosphere_data = self.coordinator.data.get("atmosphere", {})
-            return atmosphere_data.get("current_humidity")
-        return None
-
-    @property
-    def target_temperature(self) -> float | None:
-        """Return the target temperature."""
-        if self.coordinator.data:
-            atmosphere_data = self.coordinator.data.get("atmosphere", {})
-            target_min = atmosphere_data.get("target_min_temp", 75)
-            target_max = atmosphere_data.get("target_max_temp", 85)
-            return (target_min + target_max) / 2
-        return None
-
-    @property
-    def target_temperature_high(self) -> float | None:
-        """Return the high target temperature."""
-        if self.coordinator.data:
-            atmosphere_data = self.coordinator.data.get("atmosphere", {})
-            return atmosphere_data.get("target_max_temp")
-        return None
-
-    @property
-    def target_temperature_low(self) -> float | None:
-        """Return the low target temperature."""
-        if self.coordinator.data:
-            atmosphere_data = self.coordinator.data.get("atmosphere", {})
-            return atmosphere_data.get("target_min_temp")
-        return None
-
-    @property
-    def hvac_mode(self) -> HVACMode:
-        """Return current HVAC mode."""
-        return HVACMode.AUTO
-
-    @property
-    def hvac_modes(self) -> list[HVACMode]:
-        """Return available HVAC modes."""
-        return [HVACMode.AUTO]
-
-    @property
-    def hvac_action(self) -> HVACAction:
-        """Return current HVAC action."""
-        return HVACAction.IDLE
-
-    @property
-    def supported_features(self) -> ClimateEntityFeature:
-        """Return supported features."""
-        return ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
+        self._attr_unique_id = f"{entry.entry_id}_atmosphere"
+        self._attr_name = f"{coordinator.reptile_name} Tank Atmosphere"
+        
+        # Targets come from the entry config and only change on reload
+        config = coordinator.config
+        self._attr_target_temperature_low = config[CONF_ATMO_TARGET_MIN_TEMP]
+        self._attr_target_temperature_high = config[CONF_ATMO_TARGET_MAX_TEMP]
+        self._attr_target_temperature = (
+            config[CONF_ATMO_TARGET_MIN_TEMP] + config[CONF_ATMO_TARGET_MAX_TEMP]
+        ) / 2
+        super().__init__(coordinator)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, any]:
-        """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
-            
-        atmosphere_data = self.coordinator.data.get("atmosphere", {})
-        return {
+    def _update_from_data(self) -> None:
+        """Read the tank readings from the coordinator data."""
+        atmosphere_data = self.coordinator.data["atmosphere"]
+        self._attr_current_temperature = atmosphere_data.get("current_temp")
+        self._attr_current_humidity = atmosphere_data.get("current_humidity")
+        self._attr_extra_state_attributes = {
             "current_humidity": atmosphere_data.get("current_humidity"),
             "target_min_humidity": atmosphere_data.get("target_min_humidity"),
             "target_max_humidity": atmosphere_data.get("target_max_humidity"),
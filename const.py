@@ -41,9 +41,13 @@ SERVICE_LOG_FEEDING = "log_feeding"
 SERVICE_LOG_SHEDDING = "log_shedding"
 SERVICE_LOG_WEIGHT = "log_weight"
 
+# Service attributes
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+
 # Default values
-DEFAULT_UPDATE_INTERVAL = 30
+DEFAULT_UPDATE_INTERVAL = 300  # seconds, fallback for missed state changes
 DEFAULT_NOTIFICATION_COOLDOWN = 30  # minutes
+DEFAULT_ACTION_CHECK_DELAY = 10  # seconds, before re-checking a switch call
 
 # Status values
 STATUS_OK = "ok"
@@ -54,3 +58,6 @@ STATUS_CRITICAL_HIGH = "critical_high"
 STATUS_BELOW_TARGET = "below_target"
 STATUS_ABOVE_TARGET = "above_target"
 STATUS_UNKNOWN = "unknown"
+STATUS_MANUAL = "manual"
+
+CRITICAL_STATUSES = frozenset({STATUS_CRITICAL_LOW, STATUS_CRITICAL_HIGH})
@@ -1,15 +1,29 @@
 """Data coordinator for Reptile Habitat Manager."""
+import asyncio
+from collections import Counter, deque
 import logging
+import re
 from datetime import datetime, timedelta
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.const import STATE_ON, STATE_OFF
+from homeassistant.const import STATE_ON, STATE_OFF, STATE_UNAVAILABLE, STATE_UNKNOWN
 
 from .const import (
+    CRITICAL_STATUSES,
     DOMAIN,
+    DEFAULT_ACTION_CHECK_DELAY,
     DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_NOTIFICATION_COOLDOWN,
     CONF_REPTILE_NAME,
     CONF_HEAT_SOURCES,
     CONF_HEAT_NAME,
@@ -37,10 +51,29 @@ from .const import (
     STATUS_BELOW_TARGET,
     STATUS_ABOVE_TARGET,
     STATUS_UNKNOWN,
+    STATUS_MANUAL,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_BAD_STATES = frozenset((STATE_UNKNOWN, STATE_UNAVAILABLE))
+_FLOAT_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def _state_as_float(state: State | None) -> float | None:
+    """Return the numeric value of a state, or None if it has none."""
+    if state is None or state.state in _BAD_STATES:
+        return None
+    # Match plain decimals up front rather than raising on malformed states
+    if _FLOAT_RE.fullmatch(state.state):
+        return float(state.state)
+    return None
+
+
+def _days_since(log: deque[dict[str, Any]], now: datetime) -> int | None:
+    """Return whole days since the latest log entry, or None if the log is empty."""
+    return (now - log[-1]["date"]).days if log else None
+
 
 class ReptileHabitatCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Reptile Habitat data."""
@@ -49,190 +82,372 @@ class ReptileHabitatCoordinator(DataUpdateCoordinator):
         """Initialize."""
         self.entry = entry
         self.config = entry.data
+        
+        # Heat source config is static for the entry, so unpack it once
+        heat_sources = self.config[CONF_HEAT_SOURCES]
+        self._hs_names = [hs[CONF_HEAT_NAME] for hs in heat_sources]
+        self._hs_switches = [hs[CONF_HEAT_SWITCH] for hs in heat_sources]
+        self._hs_sensors = [hs[CONF_HEAT_SENSOR] for hs in heat_sources]
+        self._hs_tmin = [hs[CONF_TARGET_MIN] for hs in heat_sources]
+        self._hs_tmax = [hs[CONF_TARGET_MAX] for hs in heat_sources]
+        self._hs_cmin = [hs[CONF_CRITICAL_MIN] for hs in heat_sources]
+        self._hs_cmax = [hs[CONF_CRITICAL_MAX] for hs in heat_sources]
+        
+        self._atmo_temp_sensor = self.config[CONF_ATMO_TEMP_SENSOR]
+        self._atmo_humidity_sensor = self.config[CONF_ATMO_HUMIDITY_SENSOR]
+        self._atmo_critical_min_temp = self.config[CONF_ATMO_CRITICAL_MIN_TEMP]
+        self._atmo_critical_max_temp = self.config[CONF_ATMO_CRITICAL_MAX_TEMP]
+        self._atmo_critical_min_humidity = self.config[CONF_ATMO_CRITICAL_MIN_HUMIDITY]
+        self._atmo_critical_max_humidity = self.config[CONF_ATMO_CRITICAL_MAX_HUMIDITY]
+        
+        # Static part of the atmosphere data, copied on every update
+        self._atmo_static = {
+            "temp_sensor": self._atmo_temp_sensor,
+            "humidity_sensor": self._atmo_humidity_sensor,
+            "target_min_temp": self.config[CONF_ATMO_TARGET_MIN_TEMP],
+            "target_max_temp": self.config[CONF_ATMO_TARGET_MAX_TEMP],
+            "critical_min_temp": self._atmo_critical_min_temp,
+            "critical_max_temp": self._atmo_critical_max_temp,
+            "target_min_humidity": self.config[CONF_ATMO_TARGET_MIN_HUMIDITY],
+            "target_max_humidity": self.config[CONF_ATMO_TARGET_MAX_HUMIDITY],
+            "critical_min_humidity": self._atmo_critical_min_humidity,
+            "critical_max_humidity": self._atmo_critical_max_humidity,
+        }
+        
+        # Every entity whose state feeds into an update
+        self._tracked_entities = (
+            *self._hs_sensors,
+            *self._hs_switches,
+            self._atmo_temp_sensor,
+            self._atmo_humidity_sensor,
+        )
+        self._last_fingerprint: tuple | None = None
+        self._inputs_changed = True
+        self._unsub_action_check: CALLBACK_TYPE | None = None
+        # Switch calls from the last update, each re-checked only once
+        self._checked_actions: frozenset[tuple[str, str]] = frozenset()
+        
         self._automation_enabled = True
         self._manual_overrides = {}
-        self._last_notifications = {}
+        self._last_notifications: dict[tuple[int | str, str], datetime] = {}
+        
+        # Alert payload pieces that never change for the entry
+        self._alert_title = f"🐍 {self.config[CONF_REPTILE_NAME]} Alert"
+        self._alert_extra = {"priority": "high", "color": "red"}
+        self._alert_cooldown = timedelta(minutes=DEFAULT_NOTIFICATION_COOLDOWN)
         
-        # Care tracking
-        self._feeding_log = []
-        self._shedding_log = []
-        self._weight_log = []
+        # Care tracking, bounded to the most recent entries
+        self._feeding_log = deque(maxlen=50)
+        self._shedding_log = deque(maxlen=20)
+        self._weight_log = deque(maxlen=50)
+        # Feedings per (year, month), kept as they are logged
+        self._feeding_counts: Counter[tuple[int, int]] = Counter()
+        # Comparison of the two latest weights, refreshed on each weigh-in
+        self._weight_change: float | None = None
+        self._weight_loss_percent: float | None = None
         
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_{entry.entry_id}",
             update_interval=timedelta(seconds=DEFAULT_UPDATE_INTERVAL),
+            always_update=False,
+        )
+        
+        # React to sensor and switch changes as they happen; the update
+        # interval only acts as a safety net
+        entry.async_on_unload(
+            async_track_state_change_event(
+                hass, self._tracked_entities, self._handle_state_change
+            )
         )
+        entry.async_on_unload(self._cancel_action_check)
 
     @property
     def reptile_name(self) -> str:
         """Return reptile name."""
         return self.config[CONF_REPTILE_NAME]
 
+    @callback
+    def _handle_state_change(self, event: Event[EventStateChangedData]) -> None:
+        """Refresh when a tracked sensor or switch changes state."""
+        self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _schedule_action_check(self) -> None:
+        """Refresh once a switch call has had time to take effect.
+
+        A call the switch ignores fires no state change, so without this
+        the result would only be checked on the next update interval.
+        """
+        self._inputs_changed = True
+        self._cancel_action_check()
+        self._unsub_action_check = async_call_later(
+            self.hass, DEFAULT_ACTION_CHECK_DELAY, self._handle_action_check
+        )
+
+    @callback
+    def _handle_action_check(self, _now: datetime) -> None:
+        """Refresh after a switch call."""
+        self._unsub_action_check = None
+        self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _cancel_action_check(self) -> None:
+        """Cancel a pending switch call check."""
+        if self._unsub_action_check is not None:
+            self._unsub_action_check()
+            self._unsub_action_check = None
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from sensors and control heating."""
         try:
+            now = datetime.now()
+            days_since_feeding = _days_since(self._feeding_log, now)
+            days_since_shedding = _days_since(self._shedding_log, now)
+            days_since_weigh = _days_since(self._weight_log, now)
+
+            # Reuse the previous result if nothing it was computed from has
+            # changed. Unhealthy data is always recomputed so alerts repeat
+            # once their cooldown expires.
+            fingerprint = (
+                # The month keys this month's feeding count
+                (now.year, now.month),
+                days_since_feeding,
+                days_since_shedding,
+                days_since_weigh,
+                *self._state_fingerprint(),
+            )
+            if (
+                not self._inputs_changed
+                and fingerprint == self._last_fingerprint
+                and self.data
+                and self.data["overall_healthy"]
+            ):
+                return self.data
+            self._inputs_changed = False
+
             data = {
                 "reptile_name": self.reptile_name,
-                "heat_sources": {},
+                "heat_sources": [],
                 "atmosphere": {},
+                # Snapshot the logs so a new entry makes the data compare unequal
                 "care": {
-                    "feeding_log": self._feeding_log,
-                    "shedding_log": self._shedding_log,
-                    "weight_log": self._weight_log,
+                    "feeding_log": tuple(self._feeding_log),
+                    "shedding_log": tuple(self._shedding_log),
+                    "weight_log": tuple(self._weight_log),
+                    "days_since_feeding": days_since_feeding,
+                    "days_since_shedding": days_since_shedding,
+                    "days_since_weigh": days_since_weigh,
+                    "feedings_this_month": self._feeding_counts[(now.year, now.month)],
+                    "weight_change": self._weight_change,
+                    "weight_loss_percent": self._weight_loss_percent,
                 },
                 "automation_enabled": self._automation_enabled,
-                "last_update": datetime.now(),
             }
 
+            # Switch changes and alerts are collected and sent after processing
+            actions: list[tuple[str, str]] = []
+            alerts: list[tuple[tuple[int | str, str], str]] = []
+
             # Process heat sources
-            for i, heat_config in enumerate(self.config[CONF_HEAT_SOURCES]):
-                data["heat_sources"][i] = await self._process_heat_source(heat_config, i)
+            for i in range(len(self._hs_names)):
+                heat_data, action = self._process_heat_source(i, alerts)
+                data["heat_sources"].append(heat_data)
+                if action is not None:
+                    actions.append(action)
 
             # Process atmosphere
-            data["atmosphere"] = await self._process_atmosphere()
+            data["atmosphere"] = self._process_atmosphere(alerts)
+
+            await asyncio.gather(
+                *(
+                    self.hass.services.async_call("switch", service, {"entity_id": entity_id})
+                    for service, entity_id in actions
+                ),
+                *(self._send_alert(alert_id, message, now) for alert_id, message in alerts),
+            )
+            if actions:
+                # Retry calls the switches ignored on the next tick, but only
+                # schedule an early check the first time a call is issued
+                self._inputs_changed = True
+                issued = frozenset(actions)
+                if issued != self._checked_actions:
+                    self._schedule_action_check()
+                self._checked_actions = issued
+            else:
+                self._checked_actions = frozenset()
+
+            # Derive habitat-wide health flags once per update
+            data["active_heat_count"] = sum(
+                1 for heat_data in data["heat_sources"] if heat_data["is_heating"]
+            )
+            data["total_heat_count"] = len(data["heat_sources"])
+            data["tank_critical"] = any(
+                heat_data["status"] in CRITICAL_STATUSES
+                for heat_data in data["heat_sources"]
+            )
+            data["overall_healthy"] = (
+                not data["atmosphere"]["problem"] and not data["tank_critical"]
+            )
 
+            self._last_fingerprint = fingerprint
             return data
 
         except Exception as err:
+            self._inputs_changed = True
             raise UpdateFailed(f"Error updating data: {err}")
 
-    async def _process_heat_source(self, config: dict, index: int) -> dict[str, Any]:
-        """Process individual heat source."""
-        # Get sensor states
-        temp_state = self.hass.states.get(config[CONF_HEAT_SENSOR])
-        switch_state = self.hass.states.get(config[CONF_HEAT_SWITCH])
+    def _state_fingerprint(self) -> tuple:
+        """Return the state and last update time of every tracked entity."""
+        states_get = self.hass.states.get
+        return tuple(
+            (state.state, state.last_updated) if state is not None else None
+            for state in map(states_get, self._tracked_entities)
+        )
+
+    def _process_heat_source(
+        self, index: int, alerts: list[tuple[tuple[int | str, str], str]]
+    ) -> tuple[dict[str, Any], tuple[str, str] | None]:
+        """Process individual heat source.
+
+        Returns the heat source data and the switch service call, if any,
+        needed to bring it back into range.
+        """
+        sensor_entity = self._hs_sensors[index]
+        switch_entity = self._hs_switches[index]
         
-        current_temp = None
-        if temp_state and temp_state.state not in ["unknown", "unavailable"]:
-            try:
-                current_temp = float(temp_state.state)
-            except (ValueError, TypeError):
-                current_temp = None
+        # Get sensor states
+        states_get = self.hass.states.get
+        current_temp = _state_as_float(states_get(sensor_entity))
+        switch_state = states_get(switch_entity)
         
         is_heating = switch_state and switch_state.state == STATE_ON
         
         heat_data = {
-            "name": config[CONF_HEAT_NAME],
+            "name": self._hs_names[index],
             "current_temp": current_temp,
-            "target_min": config[CONF_TARGET_MIN],
-            "target_max": config[CONF_TARGET_MAX],
-            "critical_min": config[CONF_CRITICAL_MIN],
-            "critical_max": config[CONF_CRITICAL_MAX],
-            "switch_entity": config[CONF_HEAT_SWITCH],
-            "sensor_entity": config[CONF_HEAT_SENSOR],
+            "target_min": self._hs_tmin[index],
+            "target_max": self._hs_tmax[index],
+            "critical_min": self._hs_cmin[index],
+            "critical_max": self._hs_cmax[index],
+            "switch_entity": switch_entity,
+            "sensor_entity": sensor_entity,
             "is_heating": is_heating,
             "status": STATUS_UNKNOWN,
             "alerts": [],
         }
 
+        action = None
         if current_temp is not None:
             # Determine status and control heating
-            await self._control_heat_source(heat_data, config, index, current_temp)
+            action = self._control_heat_source(heat_data, index, current_temp, alerts)
+            if switch_state is None or switch_state.state in _BAD_STATES:
+                # Commanding a switch that reports no state would only
+                # repeat a call it cannot act on
+                action = None
         
-        return heat_data
+        return heat_data, action
 
-    async def _control_heat_source(self, heat_data: dict, config: dict, index: int, temp: float):
+    def _control_heat_source(
+        self, heat_data: dict, index: int, temp: float, alerts: list[tuple[tuple[int | str, str], str]]
+    ) -> tuple[str, str] | None:
         """Control individual heat source based on temperature."""
         # Check for critical conditions first
-        if temp <= config[CONF_CRITICAL_MIN]:
+        if temp <= self._hs_cmin[index]:
             heat_data["status"] = STATUS_CRITICAL_LOW
-            await self._send_alert(f"CRITICAL: {config[CONF_HEAT_NAME]} too cold: {temp}°F")
-            return
+            alerts.append(
+                ((index, STATUS_CRITICAL_LOW), f"CRITICAL: {self._hs_names[index]} too cold: {temp}°F")
+            )
+            return None
         
-        if temp >= config[CONF_CRITICAL_MAX]:
+        if temp >= self._hs_cmax[index]:
             heat_data["status"] = STATUS_CRITICAL_HIGH
-            await self._send_alert(f"CRITICAL: {config[CONF_HEAT_NAME]} too hot: {temp}°F")
-            return
+            alerts.append(
+                ((index, STATUS_CRITICAL_HIGH), f"CRITICAL: {self._hs_names[index]} too hot: {temp}°F")
+            )
+            return None
 
         # Only control if automation enabled and no manual override
         if not self._automation_enabled or self._manual_overrides.get(index, False):
-            heat_data["status"] = STATUS_OK if self._automation_enabled else "manual"
-            return
+            heat_data["status"] = STATUS_OK if self._automation_enabled else STATUS_MANUAL
+            return None
 
         # Normal temperature control
         is_heating = heat_data["is_heating"]
+        target_min = self._hs_tmin[index]
+        target_max = self._hs_tmax[index]
         
-        if temp < config[CONF_TARGET_MIN] and not is_heating:
+        if temp < target_min and not is_heating:
             # Turn on heating
-            await self.hass.services.async_call(
-                "switch", "turn_on", {"entity_id": config[CONF_HEAT_SWITCH]}
-            )
             heat_data["status"] = STATUS_HEATING
-        elif temp > config[CONF_TARGET_MAX] and is_heating:
+            return ("turn_on", self._hs_switches[index])
+        if temp > target_max and is_heating:
             # Turn off heating
-            await self.hass.services.async_call(
-                "switch", "turn_off", {"entity_id": config[CONF_HEAT_SWITCH]}
-            )
             heat_data["status"] = STATUS_COOLING
-        elif temp < config[CONF_TARGET_MIN]:
+            return ("turn_off", self._hs_switches[index])
+
+        if temp < target_min:
             heat_data["status"] = STATUS_BELOW_TARGET
-        elif temp > config[CONF_TARGET_MAX]:
+        elif temp > target_max:
             heat_data["status"] = STATUS_ABOVE_TARGET
         else:
             heat_data["status"] = STATUS_OK
+        return None
 
-    async def _process_atmosphere(self) -> dict[str, Any]:
+    def _process_atmosphere(self, alerts: list[tuple[tuple[int | str, str], str]]) -> dict[str, Any]:
         """Process tank atmosphere data."""
-        temp_state = self.hass.states.get(self.config[CONF_ATMO_TEMP_SENSOR])
-        humidity_state = self.hass.states.get(self.config[CONF_ATMO_HUMIDITY_SENSOR])
-        
-        current_temp = None
-        current_humidity = None
-        
-        if temp_state and temp_state.state not in ["unknown", "unavailable"]:
-            try:
-                current_temp = float(temp_state.state)
-            except (ValueError, TypeError):
-                pass
-        
-        if humidity_state and humidity_state.state not in ["unknown", "unavailable"]:
-            try:
-                current_humidity = float(humidity_state.state)
-            except (ValueError, TypeError):
-                pass
+        states_get = self.hass.states.get
+        current_temp = _state_as_float(states_get(self._atmo_temp_sensor))
+        current_humidity = _state_as_float(states_get(self._atmo_humidity_sensor))
 
-        atmosphere_data = {
-            "current_temp": current_temp,
-            "current_humidity": current_humidity,
-            "temp_sensor": self.config[CONF_ATMO_TEMP_SENSOR],
-            "humidity_sensor": self.config[CONF_ATMO_HUMIDITY_SENSOR],
-            "target_min_temp": self.config[CONF_ATMO_TARGET_MIN_TEMP],
-            "target_max_temp": self.config[CONF_ATMO_TARGET_MAX_TEMP],
-            "critical_min_temp": self.config[CONF_ATMO_CRITICAL_MIN_TEMP],
-            "critical_max_temp": self.config[CONF_ATMO_CRITICAL_MAX_TEMP],
-            "target_min_humidity": self.config[CONF_ATMO_TARGET_MIN_HUMIDITY],
-            "target_max_humidity": self.config[CONF_ATMO_TARGET_MAX_HUMIDITY],
-            "critical_min_humidity": self.config[CONF_ATMO_CRITICAL_MIN_HUMIDITY],
-            "critical_max_humidity": self.config[CONF_ATMO_CRITICAL_MAX_HUMIDITY],
-            "alerts": [],
-        }
+        atmosphere_data = self._atmo_static.copy()
+        atmosphere_data["current_temp"] = current_temp
+        atmosphere_data["current_humidity"] = current_humidity
+        atmosphere_data["problem"] = False
+        atmosphere_data["alerts"] = []
 
         # Check for critical conditions
         if current_temp is not None:
-            if current_temp <= self.config[CONF_ATMO_CRITICAL_MIN_TEMP]:
-                await self._send_alert(f"CRITICAL: Tank temperature too low: {current_temp}°F")
-            elif current_temp >= self.config[CONF_ATMO_CRITICAL_MAX_TEMP]:
-                await self._send_alert(f"CRITICAL: Tank temperature too high: {current_temp}°F")
+            if current_temp <= self._atmo_critical_min_temp:
+                atmosphere_data["problem"] = True
+                alerts.append(
+                    (("temperature", STATUS_CRITICAL_LOW), f"CRITICAL: Tank temperature too low: {current_temp}°F")
+                )
+            elif current_temp >= self._atmo_critical_max_temp:
+                atmosphere_data["problem"] = True
+                alerts.append(
+                    (("temperature", STATUS_CRITICAL_HIGH), f"CRITICAL: Tank temperature too high: {current_temp}°F")
+                )
 
         if current_humidity is not None:
-            if current_humidity <= self.config[CONF_ATMO_CRITICAL_MIN_HUMIDITY]:
-                await self._send_alert(f"CRITICAL: Tank humidity too low: {current_humidity}%")
-            elif current_humidity >= self.config[CONF_ATMO_CRITICAL_MAX_HUMIDITY]:
-                await self._send_alert(f"CRITICAL: Tank humidity too high: {current_humidity}%")
+            if current_humidity <= self._atmo_critical_min_humidity:
+                atmosphere_data["problem"] = True
+                alerts.append(
+                    (("humidity", STATUS_CRITICAL_LOW), f"CRITICAL: Tank humidity too low: {current_humidity}%")
+                )
+            elif current_humidity >= self._atmo_critical_max_humidity:
+                atmosphere_data["problem"] = True
+                alerts.append(
+                    (("humidity", STATUS_CRITICAL_HIGH), f"CRITICAL: Tank humidity too high: {current_humidity}%")
+                )
 
         return atmosphere_data
 
-    async def _send_alert(self, message: str):
-        """Send alert notification with cooldown."""
-        alert_id = message[:50]  # Use first 50 chars as ID
-        now = datetime.now()
-        
+    async def _send_alert(
+        self, alert_id: tuple[int | str, str], message: str, now: datetime
+    ):
+        """Send alert notification with cooldown.
+
+        The cooldown is tracked per alert kind (heat source index or tank
+        reading, plus which bound was crossed) rather than per message, so a
+        changing reading does not bypass it and the history stays bounded.
+        The cooldown is measured from the update tick that raised the alert.
+        """
         # Check cooldown
         if alert_id in self._last_notifications:
             last_sent = self._last_notifications[alert_id]
-            if now - last_sent < timedelta(minutes=30):
+            if now - last_sent < self._alert_cooldown:
                 return
         
         self._last_notifications[alert_id] = now
@@ -243,9 +458,9 @@ class ReptileHabitatCoordinator(DataUpdateCoordinator):
                 "notify",
                 "mobile_app_phone",
                 {
-                    "title": f"🐍 {self.reptile_name} Alert",
+                    "title": self._alert_title,
                     "message": message,
-                    "data": {"priority": "high", "color": "red"},
+                    "data": self._alert_extra,
                 }
             )
         except Exception as e:
@@ -256,10 +471,24 @@ class ReptileHabitatCoordinator(DataUpdateCoordinator):
         self._automation_enabled = enabled
         if enabled:
             self._manual_overrides.clear()
+        self._inputs_changed = True
 
     def set_manual_override(self, heat_source_index: int, override: bool):
         """Set manual override for heat source."""
         self._manual_overrides[heat_source_index] = override
+        self._inputs_changed = True
+
+    @callback
+    def async_set_heat_source_heating(self, heat_source_index: int, is_heating: bool):
+        """Optimistically record a heat source switch change until the next update."""
+        if self.data:
+            heat_data = self.data["heat_sources"][heat_source_index]
+            if bool(heat_data["is_heating"]) != is_heating:
+                self.data["active_heat_count"] += 1 if is_heating else -1
+            heat_data["is_heating"] = is_heating
+            self.async_set_updated_data(self.data)
+        # Reconcile with the real switch state in case the call had no effect
+        self._schedule_action_check()
 
     async def log_feeding(self, food_type: str, food_size: str, notes: str = ""):
         """Log a feeding event."""
@@ -270,8 +499,8 @@ class ReptileHabitatCoordinator(DataUpdateCoordinator):
             "notes": notes,
         }
         self._feeding_log.append(entry)
-        # Keep only last 50 entries
-        self._feeding_log = self._feeding_log[-50:]
+        self._feeding_counts[(entry["date"].year, entry["date"].month)] += 1
+        self._inputs_changed = True
         await self.async_request_refresh()
 
     async def log_shedding(self, complete: bool, notes: str = ""):
@@ -282,7 +511,7 @@ class ReptileHabitatCoordinator(DataUpdateCoordinator):
             "notes": notes,
         }
         self._shedding_log.append(entry)
-        self._shedding_log = self._shedding_log[-20:]
+        self._inputs_changed = True
         await self.async_request_refresh()
 
     async def log_weight(self, weight: float, unit: str = "g", notes: str = ""):
@@ -293,6 +522,18 @@ class ReptileHabitatCoordinator(DataUpdateCoordinator):
             "unit": unit,
             "notes": notes,
         }
-        self._weight_log.append(entry)
-        self._weight_log = self._weight_log[-50:]
+        weight_log = self._weight_log
+        weight_log.append(entry)
+        
+        # Compare the two most recent weight measurements
+        if len(weight_log) >= 2:
+            previous_weight = weight_log[-2]["weight"]
+            self._weight_change = weight - previous_weight
+            # There is no percentage change from a zero weight
+            self._weight_loss_percent = (
+                ((previous_weight - weight) / previous_weight) * 100
+                if previous_weight
+                else None
+            )
+        self._inputs_changed = True
         await self.async_request_refresh()
@@ -0,0 +1,49 @@
+"""Base entity for Reptile Habitat Manager."""
+from __future__ import annotations
+
+from abc import abstractmethod
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import ReptileHabitatCoordinator
+
+
+class ReptileHabitatEntity(CoordinatorEntity[ReptileHabitatCoordinator]):
+    """Base entity that is unavailable until the coordinator has data.
+
+    Subclasses set the fields their update hook needs before calling
+    ``super().__init__``, which reads the initial state.
+    """
+
+    __slots__ = ("_last_written",)
+
+    def __init__(self, coordinator: ReptileHabitatCoordinator) -> None:
+        """Initialize the entity and read its initial state."""
+        super().__init__(coordinator)
+        self._last_written: tuple | None = None
+        self._update_from_data()
+
+    @property
+    def available(self) -> bool:
+        """Return true if the coordinator has data to read from."""
+        return super().available and self.coordinator.data is not None
+
+    @abstractmethod
+    def _update_from_data(self) -> None:
+        """Set the entity's attributes from the coordinator data."""
+
+    def _state_key(self) -> tuple | None:
+        """Return the values that make up the written state, or None to always write."""
+        return None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data, skipping the write if the state key is unchanged."""
+        self._update_from_data()
+        if (key := self._state_key()) is not None:
+            written = (self.available, *key)
+            if written == self._last_written:
+                return
+            self._last_written = written
+        super()._handle_coordinator_update()
@@ -1,8 +1,6 @@
 """Sensor platform for Reptile Habitat Manager."""
 from __future__ import annotations
 
-from datetime import datetime
-
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -12,10 +10,46 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfMass, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import (
+    CONF_HEAT_NAME,
+    CONF_HEAT_SOURCES,
+    DOMAIN,
+    STATUS_CRITICAL_HIGH,
+    STATUS_CRITICAL_LOW,
+    STATUS_HEATING,
+    STATUS_OK,
+    STATUS_UNKNOWN,
+)
 from .coordinator import ReptileHabitatCoordinator
+from .entity import ReptileHabitatEntity
+
+PARALLEL_UPDATES = 0
+
+_HEAT_STATUS_ICONS = {
+    STATUS_CRITICAL_LOW: "mdi:thermometer-low",
+    STATUS_CRITICAL_HIGH: "mdi:thermometer-high",
+    STATUS_HEATING: "mdi:fire",
+    STATUS_OK: "mdi:check-circle",
+}
+
+_TANK_STATUS_ICONS = {
+    "critical": "mdi:alert-circle",
+    "ok": "mdi:check-circle",
+}
+
+_WEIGHT_TREND_ICONS = {
+    "increasing": "mdi:trending-up",
+    "decreasing": "mdi:trending-down",
+    "stable": "mdi:trending-neutral",
+}
+
+_WEIGHT_UNITS = {
+    "g": UnitOfMass.GRAMS,
+    "kg": UnitOfMass.KILOGRAMS,
+    "oz": UnitOfMass.OUNCES,
+    "lb": UnitOfMass.POUNDS,
+}
 
 
 async def async_setup_entry(
@@ -26,37 +60,38 @@ async def async_setup_entry(
     """Set up sensor entities."""
     coordinator: ReptileHabitatCoordinator = entry.runtime_data
     
-    entities = []
+    heat_source_count = len(coordinator.config[CONF_HEAT_SOURCES])
     
-    # Heat source sensors
-    for i in range(len(coordinator.config["heat_sources"])):
-        entities.extend([
-            HeatSourceTemperatureSensor(coordinator, entry, i),
-            HeatSourceStatusSensor(coordinator, entry, i),
-        ])
-    
-    # Atmosphere sensors
-    entities.extend([
+    async_add_entities((
+        # Heat source sensors
+        *(
+            sensor_class(coordinator, entry, i)
+            for i in range(heat_source_count)
+            for sensor_class in (HeatSourceTemperatureSensor, HeatSourceStatusSensor)
+        ),
+        # Atmosphere sensors
         AtmosphereTemperatureSensor(coordinator, entry),
         AtmosphereHumiditySensor(coordinator, entry),
         TankStatusSensor(coordinator, entry),
-    ])
-    
-    # Care tracking sensors
-    entities.extend([
+        # Care tracking sensors
         LastFeedingSensor(coordinator, entry),
         LastSheddingSensor(coordinator, entry),
         CurrentWeightSensor(coordinator, entry),
         FeedingCountSensor(coordinator, entry),
         WeightTrendSensor(coordinator, entry),
-    ])
-    
-    async_add_entities(entities)
+    ))
 
 
-class HeatSourceTemperatureSensor(CoordinatorEntity[ReptileHabitatCoordinator], SensorEntity):
+class HeatSourceTemperatureSensor(ReptileHabitatEntity, SensorEntity):
     """Temperature sensor for heat sources."""
 
+    __slots__ = ("_entry", "_heat_source_index")
+
+    _attr_has_entity_name = True
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+    _attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
     def __init__(
         self,
         coordinator: ReptileHabitatCoordinator,
@@ -64,45 +99,18 @@ class HeatSourceTemperatureSensor(CoordinatorEntity[ReptileHabitatCoordinator],
         heat_source_index: int,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
         self._entry = entry
         self._heat_source_index = heat_source_index
-        self._attr_has_entity_name = True
-        self._attr_device_class = SensorDeviceClass.TEMPERATURE
-        self._attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_heat_{self._heat_source_index}_temp"
-
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        if self.coordinator.data:
-            heat_data = self.coordinator.data["heat_sources"].get(self._heat_source_index)
-            if heat_data:
-                return f"{self.coordinator.reptile_name} {heat_data['name']} Temperature"
-        return f"{self.coordinator.reptile_name} Heat Source {self._heat_source_index} Temperature"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        if self.coordinator.data:
-            heat_data = self.coordinator.data["heat_sources"].get(self._heat_source_index)
-            if heat_data:
-                return heat_data.get("current_temp")
-        return None
+        self._attr_unique_id = f"{entry.entry_id}_heat_{heat_source_index}_temp"
+        heat_name = coordinator.config[CONF_HEAT_SOURCES][heat_source_index][CONF_HEAT_NAME]
+        self._attr_name = f"{coordinator.reptile_name} {heat_name} Temperature"
+        super().__init__(coordinator)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, any]:
-        """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
-            
-        heat_data = self.coordinator.data["heat_sources"].get(self._heat_source_index, {})
-        return {
+    def _update_from_data(self) -> None:
+        """Read the temperature and attributes from the coordinator data."""
+        heat_data = self.coordinator.data["heat_sources"][self._heat_source_index]
+        self._attr_native_value = heat_data.get("current_temp")
+        self._attr_extra_state_attributes = {
             "target_min": heat_data.get("target_min"),
             "target_max": heat_data.get("target_max"),
             "critical_min": heat_data.get("critical_min"),
@@ -111,10 +119,18 @@ class HeatSourceTemperatureSensor(CoordinatorEntity[ReptileHabitatCoordinator],
             "is_heating": heat_data.get("is_heating"),
         }
 
+    def _state_key(self) -> tuple:
+        """Return the values that make up the written state."""
+        return (self._attr_native_value, self._attr_extra_state_attributes)
 
-class HeatSourceStatusSensor(CoordinatorEntity[ReptileHabitatCoordinator], SensorEntity):
+
+class HeatSourceStatusSensor(ReptileHabitatEntity, SensorEntity):
     """Status sensor for heat sources."""
 
+    __slots__ = ("_entry", "_heat_source_index", "_heat_data")
+
+    _attr_has_entity_name = True
+
     def __init__(
         self,
         coordinator: ReptileHabitatCoordinator,
@@ -122,355 +138,254 @@ class HeatSourceStatusSensor(CoordinatorEntity[ReptileHabitatCoordinator], Senso
         heat_source_index: int,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
         self._entry = entry
         self._heat_source_index = heat_source_index
-        self._attr_has_entity_name = True
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_heat_{self._heat_source_index}_status"
+        self._attr_unique_id = f"{entry.entry_id}_heat_{heat_source_index}_status"
+        heat_name = coordinator.config[CONF_HEAT_SOURCES][heat_source_index][CONF_HEAT_NAME]
+        self._attr_name = f"{coordinator.reptile_name} {heat_name} Status"
+        super().__init__(coordinator)
 
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        if self.coordinator.data:
-            heat_data = self.coordinator.data["heat_sources"].get(self._heat_source_index)
-            if heat_data:
-                return f"{self.coordinator.reptile_name} {heat_data['name']} Status"
-        return f"{self.coordinator.reptile_name} Heat Source {self._heat_source_index} Status"
+    def _update_from_data(self) -> None:
+        """Cache this heat source's slice of the coordinator data."""
+        self._heat_data = self.coordinator.data["heat_sources"][self._heat_source_index]
 
     @property
     def native_value(self) -> str:
         """Return the state."""
-        if self.coordinator.data:
-            heat_data = self.coordinator.data["heat_sources"].get(self._heat_source_index)
-            if heat_data:
-                return heat_data.get("status", "unknown")
-        return "unknown"
+        return self._heat_data.get("status", STATUS_UNKNOWN)
 
     @property
     def icon(self) -> str:
         """Return the icon."""
-        status = self.native_value
-        if status == "critical_low":
-            return "mdi:thermometer-low"
-        elif status == "critical_high":
-            return "mdi:thermometer-high"
-        elif status == "heating":
-            return "mdi:fire"
-        elif status == "ok":
-            return "mdi:check-circle"
-        return "mdi:thermometer"
-
-
-class AtmosphereTemperatureSensor(CoordinatorEntity[ReptileHabitatCoordinator], SensorEntity):
+        return _HEAT_STATUS_ICONS.get(self.native_value, "mdi:thermometer")
+
+
+class AtmosphereTemperatureSensor(ReptileHabitatEntity, SensorEntity):
     """Tank atmosphere temperature sensor."""
 
+    __slots__ = ("_entry",)
+
+    _attr_has_entity_name = True
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+    _attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
     def __init__(
         self,
         coordinator: ReptileHabitatCoordinator,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
         self._entry = entry
-        self._attr_has_entity_name = True
-        self._attr_device_class = SensorDeviceClass.TEMPERATURE
-        self._attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
-        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_unique_id = f"{entry.entry_id}_atmosphere_temp"
+        self._attr_name = f"{coordinator.reptile_name} Tank Temperature"
+        super().__init__(coordinator)
 
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_atmosphere_temp"
+    def _update_from_data(self) -> None:
+        """Read the tank temperature from the coordinator data."""
+        self._attr_native_value = self.coordinator.data["atmosphere"].get("current_temp")
 
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        return f"{self.coordinator.reptile_name} Tank Temperature"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        if self.coordinator.data:
-            atmosphere_data = self.coordinator.data.get("atmosphere", {})
-            return atmosphere_data.get("current_temp")
-        return None
+    def _state_key(self) -> tuple:
+        """Return the values that make up the written state."""
+        return (self._attr_native_value,)
 
 
-class AtmosphereHumiditySensor(CoordinatorEntity[ReptileHabitatCoordinator], SensorEntity):
+class AtmosphereHumiditySensor(ReptileHabitatEntity, SensorEntity):
     """Tank atmosphere humidity sensor."""
 
+    __slots__ = ("_entry",)
+
+    _attr_has_entity_name = True
+    _attr_device_class = SensorDeviceClass.HUMIDITY
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
     def __init__(
         self,
         coordinator: ReptileHabitatCoordinator,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
         self._entry = entry
-        self._attr_has_entity_name = True
-        self._attr_device_class = SensorDeviceClass.HUMIDITY
-        self._attr_native_unit_of_measurement = PERCENTAGE
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_atmosphere_humidity"
-
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        return f"{self.coordinator.reptile_name} Tank Humidity"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        if self.coordinator.data:
-            atmosphere_data = self.coordinator.data.get("atmosphere", {})
-            return atmosphere_data.get("current_humidity")
-        return None
+        self._attr_unique_id = f"{entry.entry_id}_atmosphere_humidity"
+        self._attr_name = f"{coordinator.reptile_name} Tank Humidity"
+        super().__init__(coordinator)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, any]:
-        """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
-            
-        atmosphere_data = self.coordinator.data.get("atmosphere", {})
-        return {
+    def _update_from_data(self) -> None:
+        """Read the tank humidity and attributes from the coordinator data."""
+        atmosphere_data = self.coordinator.data["atmosphere"]
+        self._attr_native_value = atmosphere_data.get("current_humidity")
+        self._attr_extra_state_attributes = {
             "target_min": atmosphere_data.get("target_min_humidity"),
             "target_max": atmosphere_data.get("target_max_humidity"),
             "critical_min": atmosphere_data.get("critical_min_humidity"),
             "critical_max": atmosphere_data.get("critical_max_humidity"),
         }
 
+    def _state_key(self) -> tuple:
+        """Return the values that make up the written state."""
+        return (self._attr_native_value, self._attr_extra_state_attributes)
 
-class TankStatusSensor(CoordinatorEntity[ReptileHabitatCoordinator], SensorEntity):
+
+class TankStatusSensor(ReptileHabitatEntity, SensorEntity):
     """Overall tank status sensor."""
 
+    __slots__ = ("_entry",)
+
+    _attr_has_entity_name = True
+
     def __init__(
         self,
         coordinator: ReptileHabitatCoordinator,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
         self._entry = entry
-        self._attr_has_entity_name = True
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_tank_status"
-
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        return f"{self.coordinator.reptile_name} Tank Status"
+        self._attr_unique_id = f"{entry.entry_id}_tank_status"
+        self._attr_name = f"{coordinator.reptile_name} Tank Status"
+        super().__init__(coordinator)
 
-    @property
-    def native_value(self) -> str:
-        """Return the state."""
-        if not self.coordinator.data:
-            return "unknown"
-            
-        # Check heat sources for critical status
-        heat_sources = self.coordinator.data.get("heat_sources", {})
-        for heat_data in heat_sources.values():
-            if heat_data.get("status", "").startswith("critical"):
-                return "critical"
-        
-        return "ok"
+    def _update_from_data(self) -> None:
+        """Read the tank status from the coordinator data."""
+        self._attr_native_value = "critical" if self.coordinator.data["tank_critical"] else "ok"
 
     @property
     def icon(self) -> str:
         """Return the icon."""
-        status = self.native_value
-        if status == "critical":
-            return "mdi:alert-circle"
-        elif status == "ok":
-            return "mdi:check-circle"
-        return "mdi:help-circle"
+        return _TANK_STATUS_ICONS.get(self.native_value, "mdi:help-circle")
 
 
-class LastFeedingSensor(CoordinatorEntity[ReptileHabitatCoordinator], SensorEntity):
+class LastFeedingSensor(ReptileHabitatEntity, SensorEntity):
     """Last feeding date sensor."""
 
+    __slots__ = ("_entry",)
+
+    _attr_has_entity_name = True
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
     def __init__(
         self,
         coordinator: ReptileHabitatCoordinator,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
         self._entry = entry
-        self._attr_has_entity_name = True
-        self._attr_device_class = SensorDeviceClass.TIMESTAMP
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_last_feeding"
-
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        return f"{self.coordinator.reptile_name} Last Feeding"
-
-    @property
-    def native_value(self) -> datetime | None:
-        """Return the state."""
-        if self.coordinator.data:
-            feeding_log = self.coordinator.data["care"]["feeding_log"]
-            if feeding_log:
-                return feeding_log[-1]["date"]
-        return None
+        self._attr_unique_id = f"{entry.entry_id}_last_feeding"
+        self._attr_name = f"{coordinator.reptile_name} Last Feeding"
+        super().__init__(coordinator)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, any]:
-        """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
-            
-        feeding_log = self.coordinator.data["care"]["feeding_log"]
+    def _update_from_data(self) -> None:
+        """Read the last feeding and its attributes from the coordinator data."""
+        care = self.coordinator.data["care"]
+        feeding_log = care["feeding_log"]
         if feeding_log:
             last_feeding = feeding_log[-1]
-            days_since = (datetime.now() - last_feeding["date"]).days
-            return {
+            self._attr_native_value = last_feeding["date"]
+            self._attr_extra_state_attributes = {
                 "food_type": last_feeding.get("food_type"),
                 "food_size": last_feeding.get("food_size"),
                 "notes": last_feeding.get("notes"),
-                "days_since_feeding": days_since,
+                "days_since_feeding": care["days_since_feeding"],
             }
-        return {}
+        else:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = {}
 
 
-class LastSheddingSensor(CoordinatorEntity[ReptileHabitatCoordinator], SensorEntity):
+class LastSheddingSensor(ReptileHabitatEntity, SensorEntity):
     """Last shedding date sensor."""
 
+    __slots__ = ("_entry",)
+
+    _attr_has_entity_name = True
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
     def __init__(
         self,
         coordinator: ReptileHabitatCoordinator,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
         self._entry = entry
-        self._attr_has_entity_name = True
-        self._attr_device_class = SensorDeviceClass.TIMESTAMP
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_last_shedding"
-
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        return f"{self.coordinator.reptile_name} Last Shedding"
-
-    @property
-    def native_value(self) -> datetime | None:
-        """Return the state."""
-        if self.coordinator.data:
-            shedding_log = self.coordinator.data["care"]["shedding_log"]
-            if shedding_log:
-                return shedding_log[-1]["date"]
-        return None
+        self._attr_unique_id = f"{entry.entry_id}_last_shedding"
+        self._attr_name = f"{coordinator.reptile_name} Last Shedding"
+        super().__init__(coordinator)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, any]:
-        """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
-            
-        shedding_log = self.coordinator.data["care"]["shedding_log"]
+    def _update_from_data(self) -> None:
+        """Read the last shedding and its attributes from the coordinator data."""
+        care = self.coordinator.data["care"]
+        shedding_log = care["shedding_log"]
         if shedding_log:
             last_shedding = shedding_log[-1]
-            days_since = (datetime.now() - last_shedding["date"]).days
-            return {
+            self._attr_native_value = last_shedding["date"]
+            self._attr_extra_state_attributes = {
                 "complete": last_shedding.get("complete"),
                 "notes": last_shedding.get("notes"),
-                "days_since_shedding": days_since,
+                "days_since_shedding": care["days_since_shedding"],
             }
-        return {}
+        else:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = {}
 
 
-class CurrentWeightSensor(CoordinatorEntity[ReptileHabitatCoordinator], SensorEntity):
+class CurrentWeightSensor(ReptileHabitatEntity, SensorEntity):
     """Current weight sensor."""
 
+    __slots__ = ("_entry",)
+
+    _attr_has_entity_name = True
+    _attr_device_class = SensorDeviceClass.WEIGHT
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
     def __init__(
         self,
         coordinator: ReptileHabitatCoordinator,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
         self._entry = entry
-        self._attr_has_entity_name = True
-        self._attr_device_class = SensorDeviceClass.WEIGHT
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_current_weight"
+        self._attr_unique_id = f"{entry.entry_id}_current_weight"
+        self._attr_name = f"{coordinator.reptile_name} Current Weight"
+        super().__init__(coordinator)
 
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        return f"{self.coordinator.reptile_name} Current Weight"
+    def _update_from_data(self) -> None:
+        """Read the latest weight, its unit and attributes from the coordinator data."""
+        care = self.coordinator.data["care"]
+        weight_log = care["weight_log"]
+        if not weight_log:
+            self._attr_native_value = None
+            self._attr_native_unit_of_measurement = UnitOfMass.GRAMS
+            self._attr_extra_state_attributes = {}
+            return
+            
+        last_weight = weight_log[-1]
+        self._attr_native_value = last_weight["weight"]
+        self._attr_native_unit_of_measurement = _WEIGHT_UNITS.get(
+            last_weight.get("unit", "g"), UnitOfMass.GRAMS
+        )
+        self._attr_extra_state_attributes = {
+            "weight_date": last_weight["date"].isoformat(),
+            "notes": last_weight.get("notes"),
+            "days_since_weigh": care["days_since_weigh"],
+        }
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        if self.coordinator.data:
-            weight_log = self.coordinator.data["care"]["weight_log"]
-            if weight_log:
-                return weight_log[-1]["weight"]
-        return None
+    def _state_key(self) -> tuple:
+        """Return the values that make up the written state."""
+        return (
+            self._attr_native_value,
+            self._attr_native_unit_of_measurement,
+            self._attr_extra_state_attributes,
+        )
 
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return the unit of measurement."""
-        if self.coordinator.data:
-            weight_log = self.coordinator.data["care"]["weight_log"]
-            if weight_log:
-                unit = weight_log[-1].get("unit", "g")
-                if unit == "g":
-                    return UnitOfMass.GRAMS
-                elif unit == "kg":
-                    return UnitOfMass.KILOGRAMS
-                elif unit == "oz":
-                    return UnitOfMass.OUNCES
-                elif unit == "lb":
-                    return UnitOfMass.POUNDS
-        return UnitOfMass.GRAMS
 
-    @property
-    def extra_state_attributes(self) -> dict[str, any]:
-        """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
-            
-        weight_log = self.coordinator.data["care"]["weight_log"]
-        if weight_log:
-            last_weight = weight_log[-1]
-            days_since = (datetime.now() - last_weight["date"]).days
-            return {
-                "weight_date": last_weight["date"].isoformat(),
-                "notes": last_weight.get("notes"),
-                "days_since_weigh": days_since,
-            }
-        return {}
+class FeedingCountSensor(ReptileHabitatEntity, SensorEntity):
+    """Monthly feeding count sensor."""
 
+    __slots__ = ("_entry",)
 
-class FeedingCountSensor(CoordinatorEntity[ReptileHabitatCoordinator], SensorEntity):
-    """Monthly feeding count sensor."""
+    _attr_has_entity_name = True
+    _attr_state_class = SensorStateClass.TOTAL
+    _attr_icon = "mdi:food"
 
     def __init__(
         self,
@@ -478,39 +393,22 @@ class FeedingCountSensor(CoordinatorEntity[ReptileHabitatCoordinator], SensorEnt
         entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
         self._entry = entry
-        self._attr_has_entity_name = True
-        self._attr_state_class = SensorStateClass.TOTAL
-        self._attr_icon = "mdi:food"
+        self._attr_unique_id = f"{entry.entry_id}_feeding_count_month"
+        self._attr_name = f"{coordinator.reptile_name} Feedings This Month"
+        super().__init__(coordinator)
 
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_feeding_count_month"
+    def _update_from_data(self) -> None:
+        """Read this month's feeding count from the coordinator data."""
+        self._attr_native_value = self.coordinator.data["care"]["feedings_this_month"]
 
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        return f"{self.coordinator.reptile_name} Feedings This Month"
 
-    @property
-    def native_value(self) -> int:
-        """Return the state."""
-        if not self.coordinator.data:
-            return 0
-            
-        feeding_log = self.coordinator.data["care"]["feeding_log"]
-        now = datetime.now()
-        current_month_feedings = [
-            feeding for feeding in feeding_log
-            if feeding["date"].year == now.year and feeding["date"].month == now.month
-        ]
-        return len(current_month_feedings)
+class WeightTrendSensor(ReptileHabitatEntity, SensorEntity):
+    """Weight trend sensor."""
 
+    __slots__ = ("_entry",)
 
-class WeightTrendSensor(CoordinatorEntity[ReptileHabitatCoordinator], SensorEntity):
-    """Weight trend sensor."""
+    _attr_has_entity_name = True
 
     def __init__(
         self,
@@ -518,70 +416,45 @@ class WeightTrendSensor(CoordinatorEntity[ReptileHabitatCoordinator], SensorEnti
         entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
         self._entry = entry
-        self._attr_has_entity_name = True
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_weight_trend"
-
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        return f"{self.coordinator.reptile_name} Weight Trend"
+        self._attr_unique_id = f"{entry.entry_id}_weight_trend"
+        self._attr_name = f"{coordinator.reptile_name} Weight Trend"
+        super().__init__(coordinator)
 
-    @property
-    def native_value(self) -> str:
-        """Return the state."""
-        if not self.coordinator.data:
-            return "unknown"
-            
-        weight_log = self.coordinator.data["care"]["weight_log"]
-        if len(weight_log) < 2:
-            return "insufficient_data"
+    def _update_from_data(self) -> None:
+        """Compute the weight trend and attributes from the coordinator data."""
+        # The coordinator already compares the two latest measurements
+        care = self.coordinator.data["care"]
+        if care["weight_change"] is None:
+            self._attr_native_value = "insufficient_data"
+            self._attr_extra_state_attributes = {}
+            return
             
-        current_weight = weight_log[-1]["weight"]
-        previous_weight = weight_log[-2]["weight"]
-        
-        if current_weight > previous_weight * 1.02:  # 2% increase
-            return "increasing"
-        elif current_weight < previous_weight * 0.98:  # 2% decrease
-            return "decreasing"
+        if care["weight_loss_percent"] is None:
+            # The previous weight was zero, so only the direction is known
+            change_percent = None
+            self._attr_native_value = "increasing" if care["weight_change"] > 0 else "stable"
         else:
-            return "stable"
+            change_percent = -care["weight_loss_percent"]
+            if change_percent > 2:
+                self._attr_native_value = "increasing"
+            elif change_percent < -2:
+                self._attr_native_value = "decreasing"
+            else:
+                self._attr_native_value = "stable"
+
+        weight_log = care["weight_log"]
+        self._attr_extra_state_attributes = {
+            "current_weight": weight_log[-1]["weight"],
+            "previous_weight": weight_log[-2]["weight"],
+            "weight_change": round(care["weight_change"], 1),
+            "weight_change_percent": (
+                round(change_percent, 1) if change_percent is not None else None
+            ),
+            "total_measurements": len(weight_log),
+        }
 
     @property
     def icon(self) -> str:
         """Return the icon."""
-        trend = self.native_value
-        if trend == "increasing":
-            return "mdi:trending-up"
-        elif trend == "decreasing":
-            return "mdi:trending-down"
-        elif trend == "stable":
-            return "mdi:trending-neutral"
-        return "mdi:help-circle"
-
-    @property
-    def extra_state_attributes(self) -> dict[str, any]:
-        """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
-            
-        weight_log = self.coordinator.data["care"]["weight_log"]
-        if len(weight_log) >= 2:
-            current_weight = weight_log[-1]["weight"]
-            previous_weight = weight_log[-2]["weight"]
-            change = current_weight - previous_weight
-            change_percent = (change / previous_weight) * 100
-            
-            return {
-                "current_weight": current_weight,
-                "previous_weight": previous_weight,
-                "weight_change": round(change, 1),
-                "weight_change_percent": round(change_percent, 1),
-                "total_measurements": len(weight_log),
-            }
-        return {}
+        return _WEIGHT_TREND_ICONS.get(self.native_value, "mdi:help-circle")
@@ -5,13 +5,14 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import STATE_ON
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import CONF_HEAT_NAME, CONF_HEAT_SOURCES, CONF_HEAT_SWITCH, DOMAIN
 from .coordinator import ReptileHabitatCoordinator
+from .entity import ReptileHabitatEntity
+
+PARALLEL_UPDATES = 0
 
 
 async def async_setup_entry(
@@ -22,24 +23,24 @@ async def async_setup_entry(
     """Set up switch entities."""
     coordinator: ReptileHabitatCoordinator = entry.runtime_data
     
-    entities = []
-    
-    # Heat source manual control switches
-    for i in range(len(coordinator.config["heat_sources"])):
-        entities.append(HeatSourceManualSwitch(coordinator, entry, i))
+    heat_source_count = len(coordinator.config[CONF_HEAT_SOURCES])
     
-    # Master switches
-    entities.extend([
+    async_add_entities((
+        # Heat source manual control switches
+        *(HeatSourceManualSwitch(coordinator, entry, i) for i in range(heat_source_count)),
+        # Master switches
         AllHeatSourcesSwitch(coordinator, entry),
         AutomationSwitch(coordinator, entry),
-    ])
-    
-    async_add_entities(entities)
+    ))
 
 
-class HeatSourceManualSwitch(CoordinatorEntity[ReptileHabitatCoordinator], SwitchEntity):
+class HeatSourceManualSwitch(ReptileHabitatEntity, SwitchEntity):
     """Manual control switch for individual heat sources."""
 
+    __slots__ = ("_entry", "_heat_source_index", "_switch_entity", "_service_target")
+
+    _attr_has_entity_name = True
+
     def __init__(
         self,
         coordinator: ReptileHabitatCoordinator,
@@ -47,213 +48,148 @@ class HeatSourceManualSwitch(CoordinatorEntity[ReptileHabitatCoordinator], Switc
         heat_source_index: int,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator)
         self._entry = entry
         self._heat_source_index = heat_source_index
-        self._attr_has_entity_name = True
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_heat_{self._heat_source_index}_manual"
-
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        if self.coordinator.data:
-            heat_data = self.coordinator.data["heat_sources"].get(self._heat_source_index)
-            if heat_data:
-                return f"{self.coordinator.reptile_name} {heat_data['name']} Manual Control"
-        return f"{self.coordinator.reptile_name} Heat Source {self._heat_source_index} Manual"
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if the switch is on."""
-        if self.coordinator.data:
-            heat_data = self.coordinator.data["heat_sources"].get(self._heat_source_index)
-            if heat_data:
-                switch_entity = heat_data.get("switch_entity")
-                if switch_entity:
-                    await self.hass.services.async_call(
-                        "switch", "turn_off", {"entity_id": switch_entity}
-                    )
-                    # Set manual override
-                    self.coordinator.set_manual_override(self._heat_source_index, True)
-
-
-class AllHeatSourcesSwitch(CoordinatorEntity[ReptileHabitatCoordinator], SwitchEntity):
+        self._attr_unique_id = f"{entry.entry_id}_heat_{heat_source_index}_manual"
+        heat_config = coordinator.config[CONF_HEAT_SOURCES][heat_source_index]
+        self._attr_name = f"{coordinator.reptile_name} {heat_config[CONF_HEAT_NAME]} Manual Control"
+        self._switch_entity = heat_config.get(CONF_HEAT_SWITCH)
+        self._service_target = {"entity_id": self._switch_entity}
+        super().__init__(coordinator)
+
+    def _update_from_data(self) -> None:
+        """Read the switch state and attributes from this heat source's data."""
+        data = self.coordinator.data
+        heat_data = data["heat_sources"][self._heat_source_index]
+        self._attr_is_on = bool(heat_data.get("is_heating"))
+        self._attr_icon = "mdi:fire" if self._attr_is_on else "mdi:fire-off"
+        self._attr_extra_state_attributes = {
+            "controlled_entity": self._switch_entity,
+            "current_temp": heat_data.get("current_temp"),
+            "target_min": heat_data.get("target_min"),
+            "target_max": heat_data.get("target_max"),
+            "status": heat_data.get("status"),
+            "automation_active": data.get("automation_enabled", True),
+        }
+
+    def _state_key(self) -> tuple:
+        """Return the values that make up the written state."""
+        return (self._attr_is_on, self._attr_extra_state_attributes)
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn on the heat source."""
+        await self._async_set(True)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn off the heat source."""
+        await self._async_set(False)
+
+    async def _async_set(self, is_on: bool) -> None:
+        """Switch the heat source and hold it under manual control."""
+        if not self._switch_entity:
+            return
+        await self.hass.services.async_call(
+            "switch", "turn_on" if is_on else "turn_off", self._service_target
+        )
+        # Set manual override
+        self.coordinator.set_manual_override(self._heat_source_index, True)
+        self.coordinator.async_set_heat_source_heating(self._heat_source_index, is_on)
+
+
+class AllHeatSourcesSwitch(ReptileHabitatEntity, SwitchEntity):
     """Master switch to control all heat sources."""
 
+    __slots__ = ("_entry", "_service_target")
+
+    _attr_has_entity_name = True
+
     def __init__(
         self,
         coordinator: ReptileHabitatCoordinator,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator)
         self._entry = entry
-        self._attr_has_entity_name = True
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_all_heat_sources"
-
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        return f"{self.coordinator.reptile_name} All Heat Sources"
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if any heat source is on."""
-        if not self.coordinator.data:
-            return False
-            
-        heat_sources = self.coordinator.data.get("heat_sources", {})
-        return any(heat_data.get("is_heating", False) for heat_data in heat_sources.values())
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:fire-circle" if self.is_on else "mdi:fire-off"
-
-    @property
-    def extra_state_attributes(self) -> dict[str, any]:
-        """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
-            
-        heat_sources = self.coordinator.data.get("heat_sources", {})
-        active_count = sum(1 for heat_data in heat_sources.values() if heat_data.get("is_heating", False))
-        total_count = len(heat_sources)
-        
-        return {
+        self._attr_unique_id = f"{entry.entry_id}_all_heat_sources"
+        self._attr_name = f"{coordinator.reptile_name} All Heat Sources"
+        self._service_target = {
+            "entity_id": [
+                switch_entity
+                for heat_config in coordinator.config[CONF_HEAT_SOURCES]
+                if (switch_entity := heat_config.get(CONF_HEAT_SWITCH))
+            ]
+        }
+        super().__init__(coordinator)
+
+    def _update_from_data(self) -> None:
+        """Read the heat source counts from the coordinator data."""
+        data = self.coordinator.data
+        active_count = data["active_heat_count"]
+        total_count = data["total_heat_count"]
+        self._attr_is_on = active_count > 0
+        self._attr_icon = "mdi:fire-circle" if self._attr_is_on else "mdi:fire-off"
+        self._attr_extra_state_attributes = {
             "active_heat_sources": active_count,
             "total_heat_sources": total_count,
             "heating_percentage": round((active_count / total_count * 100) if total_count > 0 else 0, 1),
         }
 
+    def _state_key(self) -> tuple:
+        """Return the values that make up the written state."""
+        return (self._attr_is_on, self._attr_extra_state_attributes)
+
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on all heat sources."""
-        if self.coordinator.data:
-            heat_sources = self.coordinator.data.get("heat_sources", {})
-            for i, heat_data in heat_sources.items():
-                switch_entity = heat_data.get("switch_entity")
-                if switch_entity:
-                    await self.hass.services.async_call(
-                        "switch", "turn_on", {"entity_id": switch_entity}
-                    )
+        await self._async_switch_all("turn_on")
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off all heat sources."""
-        if self.coordinator.data:
-            heat_sources = self.coordinator.data.get("heat_sources", {})
-            for i, heat_data in heat_sources.items():
-                switch_entity = heat_data.get("switch_entity")
-                if switch_entity:
-                    await self.hass.services.async_call(
-                        "switch", "turn_off", {"entity_id": switch_entity}
-                    )
+        await self._async_switch_all("turn_off")
 
+    async def _async_switch_all(self, service: str) -> None:
+        """Call a switch service once for every controlled heat source."""
+        if not self._service_target["entity_id"]:
+            return
+        await self.hass.services.async_call("switch", service, self._service_target)
 
-class AutomationSwitch(CoordinatorEntity[ReptileHabitatCoordinator], SwitchEntity):
+
+class AutomationSwitch(ReptileHabitatEntity, SwitchEntity):
     """Switch to enable/disable automatic temperature control."""
 
+    __slots__ = ("_entry",)
+
+    _attr_has_entity_name = True
+
     def __init__(
         self,
         coordinator: ReptileHabitatCoordinator,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator)
         self._entry = entry
-        self._attr_has_entity_name = True
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"{self._entry.entry_id}_automation"
-
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        return f"{self.coordinator.reptile_name} Automatic Temperature Control"
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if automation is enabled."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("automation_enabled", True)
-        return True
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:auto-mode" if self.is_on else "mdi:hand-back-right"
-
-    @property
-    def extra_state_attributes(self) -> dict[str, any]:
-        """Return extra state attributes."""
-        return {
-            "automation_enabled": self.is_on,
-            "total_heat_sources": len(self.coordinator.config.get("heat_sources", [])),
+        self._attr_unique_id = f"{entry.entry_id}_automation"
+        self._attr_name = f"{coordinator.reptile_name} Automatic Temperature Control"
+        super().__init__(coordinator)
+
+    def _update_from_data(self) -> None:
+        """Read whether automation is enabled from the coordinator data."""
+        self._attr_is_on = self.coordinator.data.get("automation_enabled", True)
+        self._attr_icon = "mdi:auto-mode" if self._attr_is_on else "mdi:hand-back-right"
+        self._attr_extra_state_attributes = {
+            "automation_enabled": self._attr_is_on,
+            "total_heat_sources": len(self.coordinator.config[CONF_HEAT_SOURCES]),
         }
 
+    def _state_key(self) -> tuple:
+        """Return the values that make up the written state."""
+        return (self._attr_is_on, self._attr_extra_state_attributes)
+
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable automatic temperature control."""
         self.coordinator.set_automation_enabled(True)
+        await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Disable automatic temperature control."""
-        self.coordinator.set_automation_enabled(False)_entity:
-                    switch_state = self.hass.states.get(switch_entity)
-                    return switch_state and switch_state.state == STATE_ON
-        return False
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:fire" if self.is_on else "mdi:fire-off"
-
-    @property
-    def extra_state_attributes(self) -> dict[str, any]:
-        """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
-            
-        heat_data = self.coordinator.data["heat_sources"].get(self._heat_source_index, {})
-        return {
-            "controlled_entity": heat_data.get("switch_entity"),
-            "current_temp": heat_data.get("current_temp"),
-            "target_min": heat_data.get("target_min"),
-            "target_max": heat_data.get("target_max"),
-            "status": heat_data.get("status"),
-            "automation_active": self.coordinator.data.get("automation_enabled", True),
-        }
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn on the heat source."""
-        if self.coordinator.data:
-            heat_data = self.coordinator.data["heat_sources"].get(self._heat_source_index)
-            if heat_data:
-                switch_entity = heat_data.get("switch_entity")
-                if switch_entity:
-                    await self.hass.services.async_call(
-                        "switch", "turn_on", {"entity_id": switch_entity}
-                    )
-                    # Set manual override
-                    self.coordinator.set_manual_override(self._heat_source_index, True)
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn off the heat source."""
-        if self.coordinator.data:
-            heat_data = self.coordinator.data["heat_sources"].get(self._heat_source_index)
-            if heat_data:
-                switch_entity = heat_data.get("switch_entity")
-                if switch_entity:
-                    await self.hass.services.async_call(
-                        "switch", "turn_off", {"entity_id": switch_entity}
-                    )
-                    # Set manual override
-                    self.coordinator.set_manual_override(self._heat_source_index, True)
+        self.coordinator.set_automation_enabled(False)
+        await self.coordinator.async_request_refresh()